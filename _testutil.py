@@ -0,0 +1,39 @@
+"""Fake responses and canned payloads shared by test.py and conftest.py.
+
+Everything here is read-only, so the same objects can be reused across tests.
+"""
+
+import json
+from types import MappingProxyType
+
+
+class FakeResponse:
+    __slots__ = ("status_code", "text", "content")
+
+    def __init__(self, status_code=200, json_data=None, text="", content=None):
+        self.status_code = status_code
+        self.text = text
+        # body is json_data serialized; truthy by default so _handle goes down the JSON path
+        if content is None:
+            content = json.dumps(json_data).encode() if json_data is not None else b"{}"
+        self.content = content
+
+
+_CURSOR_SHELL = MappingProxyType(
+    {
+        "paginationCursorNext": None,
+        "paginationCursorPrev": None,
+        "hasMore": False,
+        "hasPrev": False,
+    }
+)
+
+
+def _single_cursor_page(data):
+    """A cursor page with no neighbours in either direction."""
+    return {"data": data, **_CURSOR_SHELL}
+
+
+# Shared canned responses; _handle only reads them, so reuse across tests is safe.
+_DELETED_RESP = FakeResponse(200, json_data={"deleted": True})
+_EMPTY_CURSOR_PAGE = FakeResponse(200, json_data=_single_cursor_page([]))
@@ -0,0 +1,85 @@
+"""Shared fixtures for test.py.
+
+Fixtures are either session-scoped and immutable (``cfg``) or function-scoped
+and cheap, so tests can run in any order or in parallel (``pytest -n auto``
+with pytest-xdist).
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from sidemail.client import (
+    _Config,
+    _EmailAPI,
+    _ContactsAPI,
+    _MessengerAPI,
+    _DomainsAPI,
+    _ProjectAPI,
+)
+
+from _testutil import FakeResponse
+
+
+@pytest.fixture(scope="session")
+def cfg():
+    return _Config(api_key="test-key", base_url="https://example.test", timeout=5.0)
+
+
+@pytest.fixture
+def mock_client():
+    return Mock(spec=["get", "post", "patch", "delete"])
+
+
+class _Registry:
+    """Canned responses: ``http.get(json=...)`` makes ``mock_client.get`` return it."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def _respond(self, verb, response, json, status):
+        if response is None:
+            response = FakeResponse(status, json_data=json)
+        getattr(self._client, verb).return_value = response
+
+    def get(self, response=None, *, json=None, status=200):
+        self._respond("get", response, json, status)
+
+    def post(self, response=None, *, json=None, status=200):
+        self._respond("post", response, json, status)
+
+    def patch(self, response=None, *, json=None, status=200):
+        self._respond("patch", response, json, status)
+
+    def delete(self, response=None, *, json=None, status=200):
+        self._respond("delete", response, json, status)
+
+
+@pytest.fixture
+def http(mock_client):
+    return _Registry(mock_client)
+
+
+@pytest.fixture
+def email_api(cfg, mock_client):
+    return _EmailAPI(cfg, mock_client)
+
+
+@pytest.fixture
+def contacts_api(cfg, mock_client):
+    return _ContactsAPI(cfg, mock_client)
+
+
+@pytest.fixture
+def messenger_api(cfg, mock_client):
+    return _MessengerAPI(cfg, mock_client)
+
+
+@pytest.fixture
+def domains_api(cfg, mock_client):
+    return _DomainsAPI(cfg, mock_client)
+
+
+@pytest.fixture
+def project_api(cfg, mock_client):
+    return _ProjectAPI(cfg, mock_client)
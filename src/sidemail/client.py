@@ -1,14 +1,78 @@
 from __future__ import annotations
 
+import asyncio
+import collections.abc
+import functools
+import itertools
+import json
 import keyword
 import base64
 import os
+import re
+import threading
 import httpx
 
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import ItemsView, KeysView, ValuesView
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterator, Mapping, Optional, List, Tuple
 from urllib.parse import quote as url_quote
 
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Resource):
+        return _plain(obj._raw)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Request bodies go through one pre-configured encoder instead of per-call
+# json.dumps(**kwargs) setup.
+_encode = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_json_default
+).encode
+
+
+def _std_dumps(obj: Any) -> bytes:
+    return _encode(obj).encode("utf-8")
+
+
+try:
+    import orjson
+
+    # Note: orjson decodes integers wider than 64 bits as float (see README).
+    _loads = orjson.loads
+    _orjson_dumps = functools.partial(
+        orjson.dumps, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+    )
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return _orjson_dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which the stdlib encoder accepts
+            return _std_dumps(obj)
+
+except ImportError:
+    _loads = json.loads
+    _dumps = _std_dumps
+
+try:
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 try:
     from importlib.metadata import version as get_version
     __version__ = get_version("sidemail")
@@ -36,34 +100,128 @@ class SidemailError(Exception):
         self.moreInfo = moreInfo
 
 
-@dataclass
 class _Config:
-    api_key: str
-    base_url: str = API_ROOT
-    timeout: float = 10.0
-    user_agent: str = f"sidemail-sdk-python/{__version__}"
+    # Plain slotted class: dataclass(slots=True) needs Python 3.10+.
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "timeout",
+        "user_agent",
+        "parser",
+        "stream_pages",
+        "headers",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = API_ROOT,
+        timeout: float = 10.0,
+        user_agent: str = f"sidemail-sdk-python/{__version__}",
+        parser: Any = None,  # simdjson.Parser when the lazy JSON backend is enabled
+        stream_pages: bool = False,  # parse list pages while they download (ijson)
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.parser = parser
+        self.stream_pages = stream_pages
+        self.headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": self.user_agent,
+        }
+
+
+_parser_lock = threading.Lock()
+
+
+def _parse_lazy(parser: Any, content: bytes) -> Any:
+    # simdjson parsers are not thread-safe; concurrent page fetches get a fresh one.
+    if _parser_lock.acquire(blocking=False):
+        try:
+            return parser.parse(content)
+        except RuntimeError:
+            # The shared parser is still pinned by a previous document
+            # (e.g. an earlier page that is still referenced).
+            pass
+        finally:
+            _parser_lock.release()
+    return simdjson.Parser().parse(content)
+
+
+def _build_client(cfg: _Config) -> httpx.Client:
+    # One pooled keep-alive (HTTP/2) client per Sidemail instance, so
+    # consecutive calls and pagination reuse the same connection.
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0,
+        ),
+        headers=cfg.headers,
+        timeout=httpx.Timeout(cfg.timeout),
+    )
+
+
+class _SessionRequests:
+    """Caller-owned httpx.Client: auth headers and timeout go on each request.
+
+    The session may be shared with other code (or other Sidemail instances with
+    a different key), so it is never mutated.
+    """
+
+    __slots__ = ("_session", "_headers", "_timeout")
 
+    def __init__(self, session: httpx.Client, cfg: _Config):
+        self._session = session
+        self._headers = cfg.headers
+        self._timeout = cfg.timeout
 
-def _headers(cfg: _Config) -> Dict[str, str]:
-    return {
-        "Authorization": f"Bearer {cfg.api_key}",
-        "Content-Type": "application/json",
-        "User-Agent": cfg.user_agent,
-    }
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._session.get(
+            url, headers=self._headers, timeout=self._timeout, **kwargs
+        )
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._session.post(
+            url, headers=self._headers, timeout=self._timeout, **kwargs
+        )
 
+    def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._session.patch(
+            url, headers=self._headers, timeout=self._timeout, **kwargs
+        )
 
-def _handle(resp: httpx.Response) -> Any:
+    def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._session.delete(
+            url, headers=self._headers, timeout=self._timeout, **kwargs
+        )
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self._session.stream(
+            method, url, headers=self._headers, timeout=self._timeout, **kwargs
+        )
+
+
+def _handle(resp: httpx.Response, parser: Any = None) -> Any:
     if 200 <= resp.status_code < 300:
         if resp.content:
             try:
-                parsed = resp.json()
+                if parser is not None:
+                    return _wrap_any(_parse_lazy(parser, resp.content))
+                parsed = _loads(resp.content)
             except ValueError:
                 return resp.text
             return _wrap_any(parsed)
         return None
     try:
-        payload = resp.json()
-    except Exception:
+        payload = _loads(resp.content)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, Mapping):
         payload = {"developerMessage": resp.text or "Unknown error"}
     msg = payload.get("developerMessage") or f"HTTP {resp.status_code}"
     raise SidemailError(
@@ -74,87 +232,213 @@ def _handle(resp: httpx.Response) -> Any:
     )
 
 
+class _ByteReader:
+    """Minimal file-like adapter feeding an iterator of byte chunks to ijson."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
+
+def _handle_stream(resp: httpx.Response) -> Any:
+    if not 200 <= resp.status_code < 300:
+        resp.read()
+        return _handle(resp)
+    chunks = resp.iter_bytes(65536)
+    first = next((c for c in chunks if c), b"")
+    if not first:
+        return None  # empty body, same as _handle
+    try:
+        page = dict(
+            ijson.kvitems(
+                _ByteReader(itertools.chain((first,), chunks)), "", use_float=True
+            )
+        )
+    except ijson.JSONError as e:
+        raise SidemailError(
+            f"Invalid JSON in response: {e}", httpStatus=resp.status_code
+        ) from e
+    return _wrap_any(page)
+
+
+_PLAIN_EMAIL = re.compile(r"[A-Za-z0-9._~+-]+@[A-Za-z0-9.-]+")
+
+
+@functools.lru_cache(maxsize=2048)
+def _quote_email(email_address: str) -> str:
+    # Common addresses only need "@" and "+" escaped; anything else goes
+    # through the general-purpose quote().
+    if _PLAIN_EMAIL.fullmatch(email_address):
+        return email_address.replace("+", "%2B").replace("@", "%40")
+    return url_quote(email_address, safe="")
+
+
+@functools.lru_cache(maxsize=1024)
 def _safe_attr(name: str) -> str:
     return f"{name}_" if (not name.isidentifier() or keyword.iskeyword(name)) else name
 
 
+# Responses of one endpoint share a key layout, so the attribute-safe-name ->
+# original-key table is built once per layout and shared by every Resource.
+_SHAPES_MAX = 1024
+_shapes: Dict[Tuple[str, ...], Dict[str, str]] = {}
+
+
+def _shape(raw: Mapping[str, Any]) -> Dict[str, str]:
+    layout = tuple(raw.keys())
+    try:
+        return _shapes[layout]
+    except KeyError:
+        pass
+    table = {_safe_attr(str(k)): k for k in layout}
+    if len(_shapes) < _SHAPES_MAX:
+        _shapes[layout] = table
+    return table
+
+
 def _wrap_any(value: Any) -> Any:
     if isinstance(value, Mapping):
         return Resource(value)  # defined below
     if isinstance(value, list):
         return [_wrap_any(v) for v in value]
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return Resource(value)
+        if isinstance(value, simdjson.Array):
+            return [_wrap_any(v) for v in value]
     return value
 
 
-class Resource(dict):
-    """Dict with dot-access preserving original (camelCase) keys."""
+def _plain(value: Any) -> Any:
+    if simdjson is not None and isinstance(value, simdjson.Object):
+        return value.as_dict()
+    return value
+
+
+class Resource:
+    """Read-only mapping with dot-access preserving original (camelCase) keys.
+
+    Nested objects and lists are wrapped on first access and cached.
+    """
+
+    __slots__ = ("_raw", "_cache", "_keys")
 
     def __init__(self, data: Mapping[str, Any]):
-        super().__init__()
-        object.__setattr__(self, "_raw", dict(data))
-        for k, v in data.items():
-            key = _safe_attr(str(k))
-            super().__setitem__(key, _wrap_any(v))
+        self._raw = data
+        self._cache: Dict[str, Any] = {}
+        self._keys: Optional[Dict[str, str]] = None
+
+    def _key_table(self) -> Dict[str, str]:
+        keys = self._keys
+        if keys is None:
+            keys = self._keys = _shape(self._raw)
+        return keys
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        value = _wrap_any(self._raw[self._key_table()[name]])
+        self._cache[name] = value
+        return value
 
     def __getattr__(self, name: str) -> Any:
+        if name in ("_raw", "_cache", "_keys") or (
+            name.startswith("__") and name.endswith("__")
+        ):
+            raise AttributeError(name)
         try:
             return self[name]
         except KeyError as e:
             raise AttributeError(name) from e
 
-    def to_dict(self) -> dict:
-        def unwind(v):
-            if isinstance(v, Resource):
-                return {k: unwind(v[k]) for k in v.keys()}
-            if isinstance(v, list):
-                return [unwind(x) for x in v]
-            return v
+    def __contains__(self, name: object) -> bool:
+        try:
+            return name in self._key_table()
+        except TypeError:
+            return False
 
-        return {k: unwind(v) for k, v in self.items()}
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_table())
+
+    def __len__(self) -> int:
+        return len(self._key_table())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def to_dict(self) -> dict:
+        raw = self._raw
+        if isinstance(raw, Mapping):
+            # A JSON round-trip is the fastest deep copy of plain JSON data.
+            return _loads(_dumps(raw))
+        return raw.as_dict()
 
     @property
     def raw(self) -> Mapping[str, Any]:
-        return self._raw
+        return _plain(self._raw)
+
+
+collections.abc.Mapping.register(Resource)
 
 
 class _EmailAPI:
+    __slots__ = ("_cfg", "_http", "_send_url", "_search_url", "_email_url")
+
     def __init__(self, cfg: _Config, http: httpx.Client):
         self._cfg = cfg
         self._http = http
+        self._send_url = f"{cfg.base_url}/email/send"
+        self._search_url = f"{cfg.base_url}/email/search"
+        self._email_url = f"{cfg.base_url}/email/"
 
     def send(self, **params) -> Dict[str, Any]:
         return _handle(
             self._http.post(
-                f"{self._cfg.base_url}/email/send",
-                headers=_headers(self._cfg),
-                json=dict(params),
-                timeout=self._cfg.timeout,
-            )
+                self._send_url,
+                content=_dumps(params),
+            ),
+            self._cfg.parser,
         )
 
     def search(self, **params) -> QueryResult:
-        endpoint_url = f"{self._cfg.base_url}/email/search"
         next_cursor_start = params.pop("paginationCursorNext", None)
         prev_cursor_start = params.pop("paginationCursorPrev", None)
         page_size = params.get("limit")
-        base_payload = dict(params)
-
-        def fetch(next_cursor, prev_cursor, limit_):
-            payload = dict(base_payload)
-            if limit_ is not None:
-                payload["limit"] = limit_
-            if next_cursor:
-                payload["paginationCursorNext"] = next_cursor
-            if prev_cursor:
-                payload["paginationCursorPrev"] = prev_cursor
-            return _handle(
-                self._http.post(
-                    endpoint_url,
-                    headers=_headers(self._cfg),
-                    json=payload,
-                    timeout=self._cfg.timeout,
-                )
-            )
+        fetch = _CursorFetcher(
+            self._http,
+            self._search_url,
+            params,
+            self._cfg,
+            in_query=False,
+        )
 
         return cursor_query(
             fetch,
@@ -164,24 +448,32 @@ class _EmailAPI:
         )
 
     def get(self, email_id: str) -> Optional[Dict[str, Any]]:
-        resp = self._http.get(
-            f"{self._cfg.base_url}/email/{email_id}",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        out = _handle(resp)
-        return out.get("email") if isinstance(out, dict) else out
+        resp = self._http.get(f"{self._email_url}{email_id}")
+        out = _handle(resp, self._cfg.parser)
+        return out.get("email") if isinstance(out, Mapping) else out
 
     def delete(self, email_id: str) -> Dict[str, Any]:
-        resp = self._http.delete(
-            f"{self._cfg.base_url}/email/{email_id}",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.delete(f"{self._email_url}{email_id}")
+        return _handle(resp, self._cfg.parser)
 
 
 class QueryResult:
+    __slots__ = (
+        "page",
+        "_data_key",
+        "_fetch_next",
+        "_fetch_prev",
+        "_fetch_at",
+        "data",
+        "total",
+        "limit",
+        "offset",
+        "paginationCursorNext",
+        "paginationCursorPrev",
+        "hasMore",
+        "hasPrev",
+    )
+
     def __init__(
         self,
         first_page: Mapping[str, Any],
@@ -189,6 +481,7 @@ class QueryResult:
         data_key: str,
         fetch_next,  # () -> (page or None, hasMore: bool)
         fetch_prev=None,  # () -> (page or None, hasPrev: bool)
+        fetch_at=None,  # (offset) -> page; enables auto_paginate_parallel
         hasMore: bool,
         hasPrev: bool = False,
         paginationCursorNext: Optional[str] = None,
@@ -200,8 +493,10 @@ class QueryResult:
         self._data_key = data_key
         self._fetch_next = fetch_next
         self._fetch_prev = fetch_prev
+        self._fetch_at = fetch_at
 
-        self.data: List[Dict[str, Any]] = list(self.page.get(data_key) or [])
+        # Shared with the first page (no copy); treat as read-only.
+        self.data: List[Dict[str, Any]] = self.page.get(data_key) or []
         self.total: Optional[int] = self.page.get("total")
         self.limit = limit
         self.offset = offset
@@ -226,6 +521,43 @@ class QueryResult:
             for it in items:
                 yield it
 
+    def auto_paginate_parallel(self, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """Like auto_paginate(), but fetches the remaining pages concurrently.
+
+        Only offset-paginated results whose first page reports ``total`` can be
+        fetched ahead; anything else falls back to auto_paginate().
+        """
+        can_prefetch = self._fetch_at and self.total is not None and self.limit
+        if not (self.hasMore and can_prefetch):
+            yield from self.auto_paginate()
+            return
+        for item in self.data:
+            yield item
+        start = (self.offset or 0) + len(self.data)
+        offsets = iter(range(start, int(self.total), self.limit))
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        # Sliding window: at most max_workers pages are requested ahead of the
+        # consumer, so stopping early does not fetch the rest of the result set.
+        window = deque(
+            pool.submit(self._fetch_at, off)
+            for off in itertools.islice(offsets, max_workers)
+        )
+        try:
+            while window:
+                page = window.popleft().result()
+                if not isinstance(page, Mapping):
+                    break
+                off = next(offsets, None)
+                if off is not None:
+                    window.append(pool.submit(self._fetch_at, off))
+                for it in page.get(self._data_key) or []:
+                    yield it
+            self.hasMore = False
+        finally:
+            for fut in window:
+                fut.cancel()
+            pool.shutdown(wait=False)
+
     def auto_paginate_prev(self) -> Iterator[Dict[str, Any]]:
         while self.hasPrev and self._fetch_prev:
             prv, self.hasPrev = self._fetch_prev()
@@ -247,32 +579,113 @@ class QueryResult:
         )
 
 
+class _OffsetPager:
+    """Offset pagination state; the bound ``fetch_next`` is handed to QueryResult."""
+
+    __slots__ = ("fetch_page", "page_size", "data_key", "offset", "received")
+
+    def __init__(
+        self, fetch_page, offset: int, page_size: Optional[int], data_key: str
+    ):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.data_key = data_key
+        self.offset = offset
+        self.received = 0
+
+    def fetch_next(self) -> Tuple[Optional[Mapping[str, Any]], bool]:
+        page_size = self.page_size
+        if page_size is not None and self.received < page_size:
+            return None, False
+        self.offset += self.received
+        page = self.fetch_page(self.offset, page_size) or {}
+        items = page.get(self.data_key) or []
+        self.received = len(items)
+        has_more = bool(page_size is not None and self.received == page_size)
+        return page, has_more
+
+    def fetch_at(self, offset: int) -> Optional[Mapping[str, Any]]:
+        return self.fetch_page(offset, self.page_size)
+
+
 def offset_query(fetch_page, *, start_offset=0, page_size=None, data_key="data"):
     """
     fetch_page(offset:int, limit:Optional[int]) -> dict with {data_key: [...]}.
     Stops when returned item count < page_size (or page_size is None and an empty page arrives).
     """
-    offset = int(start_offset or 0)
-    first = fetch_page(offset, page_size) or {}
+    pager = _OffsetPager(fetch_page, int(start_offset or 0), page_size, data_key)
+    first = fetch_page(pager.offset, page_size) or {}
     first_items = first.get(data_key) or []
-    received = len(first_items)
+    pager.received = len(first_items)
 
-    def fetch_next():
-        nonlocal offset, received
-        if page_size is not None and received < page_size:
-            return None, False
-        offset += received
-        page = fetch_page(offset, page_size) or {}
-        items = page.get(data_key) or []
-        received = len(items)
-        has_more = bool(page_size is not None and received == page_size)
-        return page, has_more
-
-    hasMore = bool(page_size is not None and received == page_size)
+    hasMore = bool(page_size is not None and pager.received == page_size)
     return QueryResult(
-        first, data_key=data_key, fetch_next=fetch_next, hasMore=hasMore
+        first,
+        data_key=data_key,
+        fetch_next=pager.fetch_next,
+        fetch_at=pager.fetch_at,
+        hasMore=hasMore,
+        offset=pager.offset,
+        limit=page_size,
+    )
+
+
+class _CursorPager:
+    """Cursor pagination state; its bound fetch_next/fetch_prev go to QueryResult."""
+
+    __slots__ = (
+        "fetch_page",
+        "page_size",
+        "next_cursor_key",
+        "prev_cursor_key",
+        "has_more_key",
+        "has_prev_key",
+        "next_cur",
+        "prev_cur",
     )
 
+    def __init__(
+        self,
+        fetch_page,
+        page_size: Optional[int],
+        next_cursor_key: str,
+        prev_cursor_key: str,
+        has_more_key: Optional[str],
+        has_prev_key: Optional[str],
+    ):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.next_cursor_key = next_cursor_key
+        self.prev_cursor_key = prev_cursor_key
+        self.has_more_key = has_more_key
+        self.has_prev_key = has_prev_key
+        self.next_cur: Optional[str] = None
+        self.prev_cur: Optional[str] = None
+
+    def fetch_next(self) -> Tuple[Optional[Mapping[str, Any]], bool]:
+        if not self.next_cur:
+            return None, False
+        page = self.fetch_page(self.next_cur, None, self.page_size) or {}
+        self.next_cur = page.get(self.next_cursor_key)
+        more = (
+            bool(page.get(self.has_more_key))
+            if self.has_more_key
+            else (self.next_cur is not None)
+        )
+        return page, more
+
+    def fetch_prev(self) -> Tuple[Optional[Mapping[str, Any]], bool]:
+        if not self.prev_cur:
+            return None, False
+        page = self.fetch_page(None, self.prev_cur, self.page_size) or {}
+        self.prev_cur = page.get(self.prev_cursor_key)
+        prev = (
+            bool(page.get(self.has_prev_key))
+            if self.has_prev_key
+            else (self.prev_cur is not None)
+        )
+        return page, prev
+
 
 def cursor_query(
     fetch_page,  # fetch_page(next_cursor:Optional[str], prev_cursor:Optional[str], limit:Optional[int]) -> Mapping
@@ -286,13 +699,19 @@ def cursor_query(
     has_more_key: Optional[str] = "hasMore",
     has_prev_key: Optional[str] = "hasPrev",
 ) -> QueryResult:
-    next_cur = start_cursor_next
-    prev_cur = start_cursor_prev
+    pager = _CursorPager(
+        fetch_page,
+        page_size,
+        next_cursor_key,
+        prev_cursor_key,
+        has_more_key,
+        has_prev_key,
+    )
 
-    first = fetch_page(next_cur, prev_cur, page_size) or {}
+    first = fetch_page(start_cursor_next, start_cursor_prev, page_size) or {}
 
-    next_cur = first.get(next_cursor_key)
-    prev_cur = first.get(prev_cursor_key)
+    pager.next_cur = next_cur = first.get(next_cursor_key)
+    pager.prev_cur = prev_cur = first.get(prev_cursor_key)
 
     has_more_first = (
         bool(first.get(has_more_key)) if has_more_key else (next_cur is not None)
@@ -301,104 +720,149 @@ def cursor_query(
         bool(first.get(has_prev_key)) if has_prev_key else (prev_cur is not None)
     )
 
-    def fetch_next() -> Tuple[Optional[Mapping[str, Any]], bool]:
-        nonlocal next_cur
-        if not next_cur:
-            return None, False
-        page = fetch_page(next_cur, None, page_size) or {}
-        next_cur = page.get(next_cursor_key)
-        more = bool(page.get(has_more_key)) if has_more_key else (next_cur is not None)
-        return page, more
-
-    def fetch_prev() -> Tuple[Optional[Mapping[str, Any]], bool]:
-        nonlocal prev_cur
-        if not prev_cur:
-            return None, False
-        page = fetch_page(None, prev_cur, page_size) or {}
-        prev_cur = page.get(prev_cursor_key)
-        prev = bool(page.get(has_prev_key)) if has_prev_key else (prev_cur is not None)
-        return page, prev
-
     return QueryResult(
         first,
         data_key=data_key,
-        fetch_next=fetch_next,
-        fetch_prev=fetch_prev,
+        fetch_next=pager.fetch_next,
+        fetch_prev=pager.fetch_prev,
         hasMore=has_more_first,
         hasPrev=has_prev_first,
-        paginationCursorNext=first.get(next_cursor_key),
-        paginationCursorPrev=first.get(prev_cursor_key),
+        paginationCursorNext=next_cur,
+        paginationCursorPrev=prev_cur,
         offset=None,
         limit=page_size,
     )
 
 
+def _set_or_drop(payload: Dict[str, Any], key: str, value: Any) -> None:
+    if value:
+        payload[key] = value
+    else:
+        payload.pop(key, None)
+
+
+class _PageFetcher:
+    """Fetches one page of a list endpoint (params as query string or JSON body).
+
+    ``base`` is owned by the fetcher: API methods hand over their own ``**params``
+    dict and must not touch it afterwards.
+    """
+
+    __slots__ = ("_http", "_url", "_base", "_parser", "_in_query", "_stream")
+
+    def __init__(
+        self,
+        http: httpx.Client,
+        url: str,
+        base: Dict[str, Any],
+        cfg: _Config,
+        *,
+        in_query: bool,
+    ):
+        self._http = http
+        self._url = url
+        self._base = base
+        self._parser = cfg.parser
+        self._in_query = in_query
+        self._stream = cfg.stream_pages and ijson is not None and cfg.parser is None
+
+    def _request(self, payload: Dict[str, Any]) -> Any:
+        if self._in_query:
+            kwargs = {"params": payload}
+        else:
+            kwargs = {"content": _dumps(payload)}
+        if self._stream:
+            method = "GET" if self._in_query else "POST"
+            with self._http.stream(method, self._url, **kwargs) as resp:
+                return _handle_stream(resp)
+        if self._in_query:
+            resp = self._http.get(self._url, **kwargs)
+        else:
+            resp = self._http.post(self._url, **kwargs)
+        page = _handle(resp, self._parser)
+        if isinstance(page, str):
+            # Same outcome as the streaming path: a list page must be JSON.
+            raise SidemailError(
+                "Invalid JSON in response", httpStatus=resp.status_code
+            )
+        return page
+
+
+class _OffsetFetcher(_PageFetcher):
+    __slots__ = ()
+
+    def __call__(self, offset: int, limit: Optional[int]) -> Any:
+        # A fresh dict per page: auto_paginate_parallel calls this from threads.
+        payload = {**self._base, "offset": offset}
+        if limit is not None:
+            payload["limit"] = limit
+        return self._request(payload)
+
+
+class _CursorFetcher(_PageFetcher):
+    __slots__ = ()
+
+    def __call__(
+        self,
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str],
+        limit: Optional[int],
+    ) -> Any:
+        # Cursor pages are fetched strictly one after another, so the base
+        # payload is updated in place and serialized before the next call.
+        payload = self._base
+        if limit is not None:
+            payload["limit"] = limit
+        _set_or_drop(payload, "paginationCursorNext", next_cursor)
+        _set_or_drop(payload, "paginationCursorPrev", prev_cursor)
+        return self._request(payload)
+
+
 class _ContactsAPI:
+    __slots__ = ("_cfg", "_http", "_contacts_url", "_query_url", "_contact_url")
+
     def __init__(self, cfg: _Config, http: httpx.Client):
         self._cfg = cfg
         self._http = http
+        self._contacts_url = f"{cfg.base_url}/contacts"
+        self._query_url = f"{cfg.base_url}/contacts/query"
+        self._contact_url = f"{cfg.base_url}/contacts/"
 
     def create_or_update(self, **params) -> Dict[str, Any]:
-        payload = dict(params)
         resp = self._http.post(
-            f"{self._cfg.base_url}/contacts",
-            headers=_headers(self._cfg),
-            json=payload,
-            timeout=self._cfg.timeout,
+            self._contacts_url,
+            content=_dumps(params),
         )
-        return _handle(resp)
+        return _handle(resp, self._cfg.parser)
 
     def find(self, email_address: str) -> Optional[Dict[str, Any]]:
-        resp = self._http.get(
-            f"{self._cfg.base_url}/contacts/{url_quote(email_address, safe='')}",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        out = _handle(resp)
-        return out.get("contact") if isinstance(out, dict) else out
+        resp = self._http.get(self._contact_url + _quote_email(email_address))
+        out = _handle(resp, self._cfg.parser)
+        return out.get("contact") if isinstance(out, Mapping) else out
 
     def query(self, **params) -> QueryResult:
         start_offset = int(params.pop("offset", 0) or 0)
         page_size = params.get("limit")
-        base_payload = dict(params)
-
-        def fetch_page(off, lim):
-            p = dict(base_payload)
-            p["offset"] = off
-            if lim is not None:
-                p["limit"] = lim
-            resp = self._http.post(
-                f"{self._cfg.base_url}/contacts/query",
-                headers=_headers(self._cfg),
-                json=p,
-                timeout=self._cfg.timeout,
-            )
-            return _handle(resp)
-
+        fetch_page = _OffsetFetcher(
+            self._http,
+            self._query_url,
+            params,
+            self._cfg,
+            in_query=False,
+        )
         return offset_query(fetch_page, start_offset=start_offset, page_size=page_size)
 
     def list(self, **params) -> QueryResult:
         next_start = params.pop("paginationCursorNext", None)
         prev_start = params.pop("paginationCursorPrev", None)
         page_size = params.get("limit")
-        base_payload = dict(params)
-
-        def fetch_page(next_cur, prev_cur, lim):
-            p = dict(base_payload)
-            if lim is not None:
-                p["limit"] = lim
-            if next_cur:
-                p["paginationCursorNext"] = next_cur
-            if prev_cur:
-                p["paginationCursorPrev"] = prev_cur
-            resp = self._http.get(
-                f"{self._cfg.base_url}/contacts",
-                headers=_headers(self._cfg),
-                params=p,
-                timeout=self._cfg.timeout,
-            )
-            return _handle(resp)
-
+        fetch_page = _CursorFetcher(
+            self._http,
+            self._contacts_url,
+            params,
+            self._cfg,
+            in_query=True,
+        )
         return cursor_query(
             fetch_page,
             start_cursor_next=next_start,
@@ -407,150 +871,116 @@ class _ContactsAPI:
         )
 
     def delete(self, email_address: str) -> Dict[str, Any]:
-        resp = self._http.delete(
-            f"{self._cfg.base_url}/contacts/{url_quote(email_address, safe='')}",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.delete(self._contact_url + _quote_email(email_address))
+        return _handle(resp, self._cfg.parser)
 
 
 class _MessengerAPI:
+    __slots__ = ("_cfg", "_http", "_messenger_url", "_item_url")
+
     def __init__(self, cfg: _Config, http: httpx.Client):
         self._cfg = cfg
         self._http = http
+        self._messenger_url = f"{cfg.base_url}/messenger"
+        self._item_url = f"{cfg.base_url}/messenger/"
 
     def list(self, **params) -> QueryResult:
         start_offset = int(params.pop("offset", 0) or 0)
         page_size = params.get("limit")
-        base = dict(params)
-
-        def fetch_page(off, lim):
-            p = dict(base)
-            p["offset"] = off
-            if lim is not None:
-                p["limit"] = lim
-            return _handle(
-                self._http.get(
-                    f"{self._cfg.base_url}/messenger",
-                    headers=_headers(self._cfg),
-                    params=p,
-                    timeout=self._cfg.timeout,
-                )
-            )
-
+        fetch_page = _OffsetFetcher(
+            self._http,
+            self._messenger_url,
+            params,
+            self._cfg,
+            in_query=True,
+        )
         return offset_query(fetch_page, start_offset=start_offset, page_size=page_size)
 
     def get(self, messenger_id: str) -> Dict[str, Any]:
         return _handle(
-            self._http.get(
-                f"{self._cfg.base_url}/messenger/{messenger_id}",
-                headers=_headers(self._cfg),
-                timeout=self._cfg.timeout,
-            )
+            self._http.get(f"{self._item_url}{messenger_id}"),
+            self._cfg.parser,
         )
 
     def create(self, **params) -> Dict[str, Any]:
         return _handle(
             self._http.post(
-                f"{self._cfg.base_url}/messenger",
-                headers=_headers(self._cfg),
-                json=dict(params),
-                timeout=self._cfg.timeout,
-            )
+                self._messenger_url,
+                content=_dumps(params),
+            ),
+            self._cfg.parser,
         )
 
     def update(self, messenger_id: str, **params) -> Dict[str, Any]:
         return _handle(
             self._http.patch(
-                f"{self._cfg.base_url}/messenger/{messenger_id}",
-                headers=_headers(self._cfg),
-                json=dict(params),
-                timeout=self._cfg.timeout,
-            )
+                f"{self._item_url}{messenger_id}",
+                content=_dumps(params),
+            ),
+            self._cfg.parser,
         )
 
     def delete(self, messenger_id: str) -> Dict[str, Any]:
         return _handle(
-            self._http.delete(
-                f"{self._cfg.base_url}/messenger/{messenger_id}",
-                headers=_headers(self._cfg),
-                timeout=self._cfg.timeout,
-            )
+            self._http.delete(f"{self._item_url}{messenger_id}"),
+            self._cfg.parser,
         )
 
 
 class _DomainsAPI:
+    __slots__ = ("_cfg", "_http", "_domains_url", "_domain_url")
+
     def __init__(self, cfg: _Config, http: httpx.Client):
         self._cfg = cfg
         self._http = http
+        self._domains_url = f"{cfg.base_url}/domains"
+        self._domain_url = f"{cfg.base_url}/domains/"
 
     def list(self) -> Dict[str, Any]:
-        resp = self._http.get(
-            f"{self._cfg.base_url}/domains",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.get(self._domains_url)
+        return _handle(resp, self._cfg.parser)
 
     def create(self, **params) -> Dict[str, Any]:
-        payload = dict(params)
         resp = self._http.post(
-            f"{self._cfg.base_url}/domains",
-            headers=_headers(self._cfg),
-            json=payload,
-            timeout=self._cfg.timeout,
+            self._domains_url,
+            content=_dumps(params),
         )
-        return _handle(resp)
+        return _handle(resp, self._cfg.parser)
 
     def delete(self, domain_id: str) -> Dict[str, Any]:
-        resp = self._http.delete(
-            f"{self._cfg.base_url}/domains/{domain_id}",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.delete(f"{self._domain_url}{domain_id}")
+        return _handle(resp, self._cfg.parser)
 
 
 class _ProjectAPI:
+    __slots__ = ("_cfg", "_http", "_project_url")
+
     def __init__(self, cfg: _Config, http: httpx.Client):
         self._cfg = cfg
         self._http = http
+        self._project_url = f"{cfg.base_url}/project"
 
     def create(self, **params) -> Dict[str, Any]:
-        payload = dict(params)
         resp = self._http.post(
-            f"{self._cfg.base_url}/project",
-            headers=_headers(self._cfg),
-            json=payload,
-            timeout=self._cfg.timeout,
+            self._project_url,
+            content=_dumps(params),
         )
-        return _handle(resp)
+        return _handle(resp, self._cfg.parser)
 
     def get(self) -> Dict[str, Any]:
-        resp = self._http.get(
-            f"{self._cfg.base_url}/project",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.get(self._project_url)
+        return _handle(resp, self._cfg.parser)
 
     def update(self, **params) -> Dict[str, Any]:
         resp = self._http.patch(
-            f"{self._cfg.base_url}/project",
-            headers=_headers(self._cfg),
-            json=dict(params),
-            timeout=self._cfg.timeout,
+            self._project_url,
+            content=_dumps(params),
         )
-        return _handle(resp)
+        return _handle(resp, self._cfg.parser)
 
     def delete(self) -> Dict[str, Any]:
-        resp = self._http.delete(
-            f"{self._cfg.base_url}/project",
-            headers=_headers(self._cfg),
-            timeout=self._cfg.timeout,
-        )
-        return _handle(resp)
+        resp = self._http.delete(self._project_url)
+        return _handle(resp, self._cfg.parser)
 
 
 class Sidemail:
@@ -561,14 +991,35 @@ class Sidemail:
         base_url: str = API_ROOT,
         timeout: float = 10.0,
         session: Optional[httpx.Client] = None,
+        json_backend: Optional[str] = None,
+        stream_pages: bool = False,
     ):
         key = api_key or os.getenv("SIDEMAIL_API_KEY")
         if not key:
             raise SidemailError(
                 "Missing API key. Pass api_key=... or set SIDEMAIL_API_KEY."
             )
-        self._cfg = _Config(api_key=key, base_url=base_url, timeout=timeout)
-        self._http = session or httpx.Client()
+        backend = json_backend or os.getenv("SIDEMAIL_JSON_BACKEND")
+        parser = None
+        if backend == "simdjson":
+            if simdjson is None:
+                raise SidemailError(
+                    "The simdjson backend requires pysimdjson (pip install pysimdjson)."
+                )
+            parser = simdjson.Parser()
+        elif backend:
+            raise SidemailError(f"Unknown JSON backend {backend!r}.")
+        self._cfg = _Config(
+            api_key=key,
+            base_url=base_url,
+            timeout=timeout,
+            parser=parser,
+            stream_pages=stream_pages,
+        )
+        if session is None:
+            self._http = _build_client(self._cfg)
+        else:
+            self._http = _SessionRequests(session, self._cfg)
 
         # Namespaced APIs for better DX
         self.email = _EmailAPI(self._cfg, self._http)
@@ -583,4 +1034,12 @@ class Sidemail:
 
     @staticmethod
     def file_to_attachment(name: str, data: bytes) -> Dict[str, str]:
-        return {"name": name, "content": base64.b64encode(data).decode("ascii")}
+        return {"name": name, "content": _b64encode(data)}
+
+    @staticmethod
+    async def file_to_attachment_async(name: str, data: bytes) -> Dict[str, str]:
+        # Encode in the default executor so several attachments can be encoded
+        # concurrently (e.g. with asyncio.gather) without blocking the loop.
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(None, _b64encode, data)
+        return {"name": name, "content": content}
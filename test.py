@@ -1,6 +1,11 @@
-import base64
+import asyncio
+import itertools
+import json
+from collections.abc import Mapping
 from unittest.mock import Mock
+from urllib.parse import quote
 
+import httpx
 import pytest
 
 from sidemail import (
@@ -9,9 +14,9 @@ from sidemail import (
 )
 
 from sidemail.client import (
-    _Config,
     _handle,
     _safe_attr,
+    _quote_email,
     _wrap_any,
     Resource,
     offset_query,
@@ -24,29 +29,15 @@ from sidemail.client import (
     _ProjectAPI,
 )
 
-
-class FakeResponse:
-    def __init__(self, status_code=200, json_data=None, text="", content=b"{}"):
-        self.status_code = status_code
-        self._json_data = json_data
-        self.text = text
-        # make content truthy by default so _handle goes down the JSON path
-        self.content = content if content is not None else b"{}"
-
-    def json(self):
-        if self._json_data is None:
-            raise ValueError("No JSON data")
-        return self._json_data
-
-
-@pytest.fixture
-def cfg():
-    return _Config(api_key="test-key", base_url="https://example.test", timeout=5.0)
+from _testutil import (
+    FakeResponse,
+    _single_cursor_page,
+    _DELETED_RESP,
+    _EMPTY_CURSOR_PAGE,
+)
 
 
-@pytest.fixture
-def mock_client():
-    return Mock()
+_HELLO_B64 = "aGVsbG8="  # base64 of b"hello"
 
 
 # -------------------------
@@ -60,6 +51,14 @@ def test_safe_attr():
     assert _safe_attr("1abc") == "1abc_"  # not identifier
 
 
+@pytest.mark.parametrize(
+    "email",
+    ["a@example.com", "first.last+tag@sub.example.co", "we ird/é@example.com"],
+)
+def test_quote_email_matches_url_quote(email):
+    assert _quote_email(email) == quote(email, safe="")
+
+
 def test_wrap_any_mapping_and_list():
     mapping_value = {"SomeKey": 1}
     wrapped = _wrap_any(mapping_value)
@@ -97,84 +96,186 @@ def test_resource_dot_access_and_to_dict():
     assert res.raw == data
 
 
+def test_resource_wraps_children_on_access_and_caches():
+    res = Resource({"meta": {"createdAt": "now"}, "class": 1})
+    assert res._cache == {}
+
+    assert res.meta is res.meta
+    assert res["class_"] == 1
+    assert "class_" in res
+    assert "class" not in res
+    assert list(res) == ["meta", "class_"]
+
+
+def test_resource_to_dict_is_a_copy_with_original_keys():
+    data = {"class": {"items": [1, 2]}}
+    res = Resource(data)
+
+    as_dict = res.to_dict()
+    assert as_dict == data
+    as_dict["class"]["items"].append(3)
+    assert data == {"class": {"items": [1, 2]}}
+
+
+def test_resource_is_a_slotted_mapping():
+    res = Resource({"id": "1", "class": 2})
+    assert isinstance(res, Mapping)
+    assert not hasattr(res, "__dict__")
+    assert res == {"id": "1", "class_": 2}
+    assert dict(res.items()) == {"id": "1", "class_": 2}
+    assert res.get("missing", "x") == "x"
+
+
+def test_resource_len_matches_iteration_when_safe_names_collide():
+    res = Resource({"class": 1, "class_": 2})
+    assert len(res) == len(list(res)) == len(res.items())
+
+
+def test_resources_with_same_layout_share_key_table():
+    first = Resource({"id": "1", "class": "a"})
+    second = Resource({"id": "2", "class": "b"})
+
+    assert first.class_ == "a"
+    assert second.class_ == "b"
+    assert first._keys is second._keys
+
+
 def test_resource_missing_attr_raises_attribute_error():
     res = Resource({"foo": 1})
     with pytest.raises(AttributeError):
         _ = res.bar
 
 
+def test_resource_allows_double_underscore_payload_keys():
+    res = Resource({"__v": 0})
+    assert getattr(res, "__v") == 0
+    with pytest.raises(AttributeError):
+        _ = res.__missing_dunder__
+
+
 # -------------------------
 # _handle + errors
 # -------------------------
 
 
-def test_handle_success_json():
-    resp = FakeResponse(status_code=200, json_data={"ok": True})
+@pytest.mark.parametrize(
+    "status, json_data, text, content, expected",
+    [
+        (200, {"ok": True}, "", None, {"ok": True}),
+        # body that is not JSON -> falls back to resp.text
+        (200, None, "plain text", b"x", "plain text"),
+        # 2xx, but no body at all -> the "return None" branch
+        (204, None, "", b"", None),
+    ],
+    ids=["json", "text", "empty"],
+)
+def test_handle_success(status, json_data, text, content, expected):
+    resp = FakeResponse(status, json_data=json_data, text=text, content=content)
     result = _handle(resp)
-    # wrapped as Resource
-    assert isinstance(result, Resource)
-    assert result.ok is True
+    if isinstance(expected, dict):
+        # wrapped as Resource
+        assert isinstance(result, Resource)
+        assert result.ok is True
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "status, json_data, text, message, error_code, more_info",
+    [
+        (401, {"developerMessage": "Nope"}, "Nope", "Nope", None, None),
+        (
+            500,
+            {
+                "developerMessage": "Internal error",
+                "errorCode": "INTERNAL",
+                "moreInfo": "https://docs.example.com",
+            },
+            "Internal error",
+            "Internal error",
+            "INTERNAL",
+            "https://docs.example.com",
+        ),
+        # non-JSON body -> fallback payload using resp.text
+        (500, None, "Server exploded", "Server exploded", None, None),
+    ],
+    ids=["auth", "api", "non-json"],
+)
+def test_handle_error_raises_sidemail_error(
+    status, json_data, text, message, error_code, more_info
+):
+    content = b"" if json_data is None else None
+    resp = FakeResponse(status, json_data=json_data, text=text, content=content)
 
+    try:
+        _handle(resp)
+    except SidemailError as err:
+        assert message in str(err)
+        assert err.httpStatus == status
+        assert err.errorCode == error_code
+        assert err.moreInfo == more_info
+    else:
+        pytest.fail("expected SidemailError")
+
+
+def test_handle_simdjson_backend_decodes_lazily():
+    simdjson = pytest.importorskip("simdjson")
+    parser = simdjson.Parser()
+    data = {"class": 1, "meta": {"createdAt": "now"}, "items": [{"id": "1"}]}
+
+    res = _handle(FakeResponse(200, json_data=data), parser)
+    assert res.class_ == 1
+    assert res.meta.createdAt == "now"
+    assert res["items"][0].id == "1"
+    assert set(res) == {"class_", "meta", "items"}
+    assert res.to_dict() == data
 
-def test_handle_success_text_fallback():
-    resp = FakeResponse(
-        status_code=200, json_data=None, text="plain text", content=b"x"
-    )
+    # the shared parser is pinned by `res`, a second page must still parse
+    other = _handle(FakeResponse(200, json_data={"data": []}), parser)
+    assert other.data == []
+    assert res.meta.createdAt == "now"
 
-    def bad_json():
-        raise ValueError("no json")
 
-    resp.json = bad_json
-    result = _handle(resp)
-    assert result == "plain text"
+# -------------------------
+# Pagination helpers
+# -------------------------
 
 
-def test_handle_auth_error_raises_sidemail_error():
-    resp = FakeResponse(
-        status_code=401,
-        json_data={"developerMessage": "Nope"},
-        text="Nope",
-        content=b"{}",
-    )
-    with pytest.raises(SidemailError) as exc:
-        _handle(resp)
-    assert "Nope" in str(exc.value)
-    assert exc.value.httpStatus == 401
+class _PageServer:
+    """offset_query fetch_page stub returning canned pages in call order."""
 
+    __slots__ = ("pages", "count")
 
-def test_handle_api_error_raises_sidemail_error():
-    resp = FakeResponse(
-        status_code=500,
-        json_data={"developerMessage": "Internal error", "errorCode": "INTERNAL", "moreInfo": "https://docs.example.com"},
-        text="Internal error",
-        content=b"{}",
-    )
-    with pytest.raises(SidemailError) as exc:
-        _handle(resp)
-    assert exc.value.httpStatus == 500
-    assert exc.value.errorCode == "INTERNAL"
-    assert exc.value.moreInfo == "https://docs.example.com"
+    def __init__(self, pages):
+        self.pages = pages
+        self.count = 0
 
+    def __call__(self, offset, limit):
+        page = self.pages[self.count]
+        self.count += 1
+        return page
 
-# -------------------------
-# Pagination helpers
-# -------------------------
 
+class _CursorServer:
+    """cursor_query fetch_page stub dispatching on (next_cursor, prev_cursor)."""
 
-def test_offset_query_basic():
-    pages = [
-        {"data": [1, 2, 3]},
-        {"data": [4, 5, 6]},
-        {"data": []},
-    ]
+    __slots__ = ("pages",)
 
-    calls = {"count": 0}
+    def __init__(self, pages):
+        self.pages = pages
 
-    def fetch_page(offset, limit):
-        # ignore offset/limit for simplicity; just step through pages
-        idx = calls["count"]
-        calls["count"] += 1
-        return pages[idx]
+    def __call__(self, next_cursor, prev_cursor, limit):
+        # an unexpected cursor pair is a test failure (KeyError)
+        return self.pages[(next_cursor, prev_cursor)]
+
+
+def test_offset_query_basic():
+    fetch_page = _PageServer(
+        [
+            {"data": [1, 2, 3]},
+            {"data": [4, 5, 6]},
+            {"data": []},
+        ]
+    )
 
     qr = offset_query(fetch_page, start_offset=0, page_size=3, data_key="data")
 
@@ -185,28 +286,71 @@ def test_offset_query_basic():
     assert all_items == [1, 2, 3, 4, 5, 6]
 
 
+def test_offset_query_auto_paginate_parallel_uses_total():
+    pages = {0: [1, 2], 2: [3, 4], 4: [5]}
+    offsets = []
+
+    def fetch_page(offset, limit):
+        offsets.append(offset)
+        return {"data": pages[offset], "total": 5}
+
+    qr = offset_query(fetch_page, start_offset=0, page_size=2, data_key="data")
+
+    assert list(qr.auto_paginate_parallel(max_workers=2)) == [1, 2, 3, 4, 5]
+    assert sorted(offsets) == [0, 2, 4]
+    assert qr.hasMore is False
+
+
+def test_auto_paginate_parallel_stops_fetching_on_early_break():
+    offsets = []
+
+    def fetch_page(offset, limit):
+        offsets.append(offset)
+        return {"data": list(range(offset, offset + limit)), "total": 100000}
+
+    qr = offset_query(fetch_page, start_offset=0, page_size=10, data_key="data")
+    items = qr.auto_paginate_parallel(max_workers=2)
+
+    assert list(itertools.islice(items, 16)) == list(range(16))
+    assert qr.hasMore is True  # iteration has not finished yet
+    items.close()
+
+    # first page + a window of two + one refill for the page consumed
+    assert len(offsets) <= 4
+    assert qr.hasMore is True
+
+
+def test_auto_paginate_parallel_without_total_falls_back_to_serial():
+    pages = [{"data": [1, 2]}, {"data": [3]}]
+
+    def fetch_page(offset, limit):
+        return pages[offset // 2]
+
+    qr = offset_query(fetch_page, start_offset=0, page_size=2, data_key="data")
+    assert list(qr.auto_paginate_parallel()) == [1, 2, 3]
+
+
 def test_cursor_query_basic():
     # simulate two-page cursor pagination
-    def fetch_page(next_cursor, prev_cursor, limit):
-        if next_cursor is None and prev_cursor is None:
+    fetch_page = _CursorServer(
+        {
             # first page
-            return {
+            (None, None): {
                 "data": [1, 2],
                 "paginationCursorNext": "next-token",
                 "paginationCursorPrev": None,
                 "hasMore": True,
                 "hasPrev": False,
-            }
-        if next_cursor == "next-token":
-            return {
+            },
+            ("next-token", None): {
                 "data": [3, 4],
                 "paginationCursorNext": None,
                 "paginationCursorPrev": "prev-token",
                 "hasMore": False,
                 "hasPrev": True,
-            }
-        # fallback
-        return {"data": []}
+            },
+        }
+    )
 
     qr = cursor_query(fetch_page, page_size=2)
     assert qr.data == [1, 2]
@@ -215,63 +359,58 @@ def test_cursor_query_basic():
     items = list(qr.auto_paginate())
     assert items == [1, 2, 3, 4]
 
-    # hit the fallback branch so coverage doesn't treat it as dead
-    assert fetch_page("weird-next", "weird-prev", 10) == {"data": []}
-
 
 # -------------------------
 # _EmailAPI
 # -------------------------
 
 
-def test_email_send_uses_post_no_transform(cfg, mock_client):
-    mock_client.post.return_value = FakeResponse(200, json_data={"ok": True})
-    api = _EmailAPI(cfg, mock_client)
+def test_email_send_uses_post_no_transform(mock_client, http, email_api):
+    http.post(json={"ok": True})
 
-    result = api.send(customField="value")
-    mock_client.post.assert_called_once()
-    _, kwargs = mock_client.post.call_args
-
-    assert kwargs["json"]["customField"] == "value"
+    result = email_api.send(customField="value")
+    assert mock_client.post.call_count == 1
+    assert json.loads(mock_client.post.call_args.kwargs["content"])["customField"] == "value"
     assert isinstance(result, Resource)
     assert result.ok is True
 
 
-def test_email_get_returns_email_field(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"email": {"id": "123", "subject": "Hi"}},
-    )
-    api = _EmailAPI(cfg, mock_client)
+def test_email_send_serializes_resource_values(mock_client, http, email_api):
+    http.post(json={"ok": True})
+
+    email_api.send(templateProps=Resource({"class": {"name": "Ada"}}))
+    sent = json.loads(mock_client.post.call_args.kwargs["content"])
+    assert sent == {"templateProps": {"class": {"name": "Ada"}}}
+
+
+def test_email_send_accepts_non_str_keys_and_big_ints(mock_client, http, email_api):
+    http.post(json={"ok": True})
+
+    email_api.send(templateProps={1: "a"}, big=2**70)
+    sent = json.loads(mock_client.post.call_args.kwargs["content"])
+    assert sent == {"templateProps": {"1": "a"}, "big": 2**70}
 
-    result = api.get("123")
+
+def test_email_get_returns_email_field(mock_client, http, email_api):
+    http.get(json={"email": {"id": "123", "subject": "Hi"}})
+
+    result = email_api.get("123")
     assert result["subject"] == "Hi"
+    assert mock_client.get.call_args.args[0] == "https://example.test/email/123"
 
 
-def test_email_delete_uses_delete(cfg, mock_client):
-    mock_client.delete.return_value = FakeResponse(200, json_data={"deleted": True})
-    api = _EmailAPI(cfg, mock_client)
+def test_email_get_accepts_non_str_id(mock_client, http, email_api):
+    http.get(json={"email": {"id": "123"}})
 
-    result = api.delete("123")
-    mock_client.delete.assert_called_once()
-    assert result.deleted is True
+    email_api.get(123)
+    assert mock_client.get.call_args.args[0] == "https://example.test/email/123"
 
 
-def test_email_search_uses_cursor_query(cfg, mock_client):
+def test_email_search_uses_cursor_query(http, email_api):
     # simulate one-page cursor response
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={
-            "data": [{"id": "1"}, {"id": "2"}],
-            "paginationCursorNext": None,
-            "paginationCursorPrev": None,
-            "hasMore": False,
-            "hasPrev": False,
-        },
-    )
-    api = _EmailAPI(cfg, mock_client)
+    http.post(json=_single_cursor_page([{"id": "1"}, {"id": "2"}]))
 
-    qr = api.search(status="sent", limit=2)
+    qr = email_api.search(status="sent", limit=2)
     assert isinstance(qr, QueryResult)
     assert [item["id"] for item in qr.data] == ["1", "2"]
 
@@ -281,221 +420,251 @@ def test_email_search_uses_cursor_query(cfg, mock_client):
 # -------------------------
 
 
-def test_contacts_create_or_update(cfg, mock_client):
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={"contact": {"emailAddress": "a@example.com"}},
-    )
-    api = _ContactsAPI(cfg, mock_client)
-
-    result = api.create_or_update(emailAddress="a@example.com", firstName="Ada")
-    mock_client.post.assert_called_once()
-    _, kwargs = mock_client.post.call_args
-    # camelized keys
-    assert kwargs["json"]["emailAddress"] == "a@example.com"
-    assert kwargs["json"]["firstName"] == "Ada"
+def test_contacts_create_or_update(mock_client, http, contacts_api):
+    http.post(json={"contact": {"emailAddress": "a@example.com"}})
+
+    result = contacts_api.create_or_update(emailAddress="a@example.com", firstName="Ada")
+    assert mock_client.post.call_count == 1
+    # keys are sent through unchanged
+    sent = json.loads(mock_client.post.call_args.kwargs["content"])
+    assert sent["emailAddress"] == "a@example.com"
+    assert sent["firstName"] == "Ada"
     assert result.contact.emailAddress == "a@example.com"
 
 
-def test_contacts_find(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"contact": {"emailAddress": "a@example.com"}},
-    )
-    api = _ContactsAPI(cfg, mock_client)
-    result = api.find("a@example.com")
+def test_contacts_find(mock_client, http, contacts_api):
+    http.get(json={"contact": {"emailAddress": "a@example.com"}})
+    result = contacts_api.find("a@example.com")
     assert result.emailAddress == "a@example.com"
+    assert mock_client.get.call_args.args[0] == "https://example.test/contacts/a%40example.com"
 
 
-def test_contacts_query_uses_offset_pagination(cfg, mock_client):
+def test_contacts_query_uses_offset_pagination(http, contacts_api):
     # single page
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={"data": [{"emailAddress": "a@example.com"}]},
-    )
-    api = _ContactsAPI(cfg, mock_client)
-    qr = api.query(limit=10)
+    http.post(json={"data": [{"emailAddress": "a@example.com"}]})
+    qr = contacts_api.query(limit=10)
     assert len(qr.data) == 1
     assert qr.data[0].emailAddress == "a@example.com"
 
 
-def test_contacts_list_uses_cursor_pagination(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={
-            "data": [{"emailAddress": "a@example.com"}],
-            "paginationCursorNext": None,
-            "paginationCursorPrev": None,
-            "hasMore": False,
-            "hasPrev": False,
-        },
-    )
-    api = _ContactsAPI(cfg, mock_client)
-    qr = api.list(limit=10)
+def test_contacts_list_uses_cursor_pagination(http, contacts_api):
+    http.get(json=_single_cursor_page([{"emailAddress": "a@example.com"}]))
+    qr = contacts_api.list(limit=10)
     assert len(qr.data) == 1
     assert qr.data[0].emailAddress == "a@example.com"
 
 
-def test_contacts_delete(cfg, mock_client):
-    mock_client.delete.return_value = FakeResponse(200, json_data={"deleted": True})
-    api = _ContactsAPI(cfg, mock_client)
+# -------------------------
+# _MessengerAPI
+# -------------------------
+
+
+@pytest.mark.parametrize(
+    "method, verb, args, params, resp_json, url",
+    [
+        ("list", "get", (), {"limit": 5}, {"data": [{"id": "m1"}]}, "messenger"),
+        ("get", "get", ("m1",), {}, {"id": "m1", "name": "Messenger"}, "messenger/m1"),
+        ("create", "post", (), {"name": "New"}, {"id": "m1", "name": "New"}, "messenger"),
+        (
+            "update",
+            "patch",
+            ("m1",),
+            {"name": "Updated"},
+            {"id": "m1", "name": "Updated"},
+            "messenger/m1",
+        ),
+        ("delete", "delete", ("m1",), {}, {"id": "m1", "deleted": True}, "messenger/m1"),
+    ],
+    ids=["list", "get", "create", "update", "delete"],
+)
+def test_messenger_crud(
+    mock_client, http, messenger_api, method, verb, args, params, resp_json, url
+):
+    getattr(http, verb)(json=resp_json)
 
-    result = api.delete("a@example.com")
-    assert result.deleted is True
-    mock_client.delete.assert_called_once()
+    result = getattr(messenger_api, method)(*args, **params)
+    sent = getattr(mock_client, verb)
+    assert sent.call_count == 1
+    assert sent.call_args.args[0] == f"https://example.test/{url}"
+    if verb in ("post", "patch"):
+        assert json.loads(sent.call_args.kwargs["content"]) == params
+
+    if method == "list":
+        assert [m["id"] for m in result.data] == ["m1"]
+    else:
+        assert result == resp_json
 
 
 # -------------------------
-# _MessengerAPI
+# _DomainsAPI
 # -------------------------
 
 
-def test_messenger_list_uses_offset_query(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"data": [{"id": "m1"}]},
-    )
-    api = _MessengerAPI(cfg, mock_client)
+def test_domains_list(http, domains_api):
+    http.get(json={"data": [{"id": "d1", "name": "example.com"}]})
 
-    qr = api.list(limit=5)
-    assert [m["id"] for m in qr.data] == ["m1"]
+    result = domains_api.list()
+    assert result.data[0].name == "example.com"
 
 
-def test_messenger_get(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"id": "m1", "name": "Messenger"},
-    )
-    api = _MessengerAPI(cfg, mock_client)
+# -------------------------
+# _ProjectAPI
+# -------------------------
 
-    result = api.get("m1")
-    assert result.id == "m1"
 
+def test_project_update(http, project_api):
+    http.patch(json={"id": "p1", "name": "Updated Project"})
 
-def test_messenger_create(cfg, mock_client):
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={"id": "m1", "name": "My Messenger"},
-    )
-    api = _MessengerAPI(cfg, mock_client)
+    result = project_api.update(data={"name": "Updated Project"})
+    assert result.name == "Updated Project"
 
-    result = api.create(name="My Messenger")
-    mock_client.post.assert_called_once()
-    assert result.name == "My Messenger"
 
+def test_project_get(http, project_api):
+    http.get(json={"id": "p1", "name": "My Project"})
 
-def test_messenger_update(cfg, mock_client):
-    mock_client.patch.return_value = FakeResponse(
-        200,
-        json_data={"id": "m1", "name": "Updated"},
-    )
-    api = _MessengerAPI(cfg, mock_client)
+    result = project_api.get()
+    assert result.id == "p1"
+    assert result.name == "My Project"
 
-    result = api.update("m1", name="Updated")
-    mock_client.patch.assert_called_once()
-    assert result.name == "Updated"
 
+# -------------------------
+# Shared verbs across APIs
+# -------------------------
 
-def test_messenger_delete(cfg, mock_client):
-    mock_client.delete.return_value = FakeResponse(200, json_data={"deleted": True})
-    api = _MessengerAPI(cfg, mock_client)
 
-    result = api.delete("m1")
+@pytest.mark.parametrize(
+    "api_cls, args",
+    [
+        (_EmailAPI, ("123",)),
+        (_ContactsAPI, ("a@example.com",)),
+        (_DomainsAPI, ("d1",)),
+        (_ProjectAPI, ()),
+    ],
+)
+def test_delete_verb(cfg, mock_client, http, api_cls, args):
+    http.delete(_DELETED_RESP)
+    api = api_cls(cfg, mock_client)
+
+    result = api.delete(*args)
+    assert mock_client.delete.call_count == 1
     assert result.deleted is True
 
 
-# -------------------------
-# _DomainsAPI
-# -------------------------
+@pytest.mark.parametrize(
+    "api_cls, name",
+    [
+        (_DomainsAPI, "example.com"),
+        (_ProjectAPI, "My Project"),
+    ],
+)
+def test_create_verb(cfg, mock_client, http, api_cls, name):
+    http.post(json={"id": "x1", "name": name})
+    api = api_cls(cfg, mock_client)
 
+    result = api.create(name=name)
+    assert mock_client.post.call_count == 1
+    assert json.loads(mock_client.post.call_args.kwargs["content"]) == {"name": name}
+    assert result.name == name
 
-def test_domains_list(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"data": [{"id": "d1", "name": "example.com"}]},
-    )
-    api = _DomainsAPI(cfg, mock_client)
 
-    result = api.list()
-    assert result.data[0].name == "example.com"
+def test_sidemail_requires_api_key(monkeypatch):
+    monkeypatch.delenv("SIDEMAIL_API_KEY", raising=False)
+    with pytest.raises(SidemailError):
+        Sidemail()
 
 
-def test_domains_create(cfg, mock_client):
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={"id": "d1", "name": "example.com"},
-    )
-    api = _DomainsAPI(cfg, mock_client)
+def test_sidemail_reads_api_key_from_env(monkeypatch):
+    monkeypatch.setenv("SIDEMAIL_API_KEY", "env-key")
+    client = Sidemail()
+    assert client._cfg.api_key == "env-key"
 
-    result = api.create(name="example.com")
-    mock_client.post.assert_called_once()
-    assert result.name == "example.com"
 
+def test_sidemail_instances_sharing_a_session_send_their_own_key():
+    seen = []
 
-def test_domains_delete(cfg, mock_client):
-    mock_client.delete.return_value = FakeResponse(200, json_data={"deleted": True})
-    api = _DomainsAPI(cfg, mock_client)
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"id": "p1"})
 
-    result = api.delete("d1")
-    assert result.deleted is True
+    session = httpx.Client(transport=httpx.MockTransport(handler), timeout=60.0)
+    first = Sidemail(api_key="key-A", timeout=3.0, session=session)
+    second = Sidemail(api_key="key-B", timeout=3.0, session=session)
 
+    first.project.get()
+    second.project.get()
+    first.project.get()
+    assert seen == ["Bearer key-A", "Bearer key-B", "Bearer key-A"]
 
-# -------------------------
-# _ProjectAPI
-# -------------------------
+    # the caller's session is left as it was
+    assert "Authorization" not in session.headers
+    assert session.timeout.read == 60.0
 
 
-def test_project_create(cfg, mock_client):
-    mock_client.post.return_value = FakeResponse(
-        200,
-        json_data={"id": "p1", "name": "My Project"},
-    )
-    api = _ProjectAPI(cfg, mock_client)
+def test_sidemail_stream_pages_parses_list_pages_incrementally():
+    pytest.importorskip("ijson")
 
-    result = api.create(name="My Project")
-    assert result.name == "My Project"
+    def handler(request):
+        assert request.url.params["limit"] == "2"
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"emailAddress": "a@example.com"}, {"emailAddress": "b@example.com"}],
+                "paginationCursorNext": None,
+                "hasMore": False,
+            },
+        )
 
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = Sidemail(api_key="key", session=session, stream_pages=True)
 
-def test_project_get(cfg, mock_client):
-    mock_client.get.return_value = FakeResponse(
-        200,
-        json_data={"id": "p1", "name": "My Project"},
-    )
-    api = _ProjectAPI(cfg, mock_client)
+    qr = client.contacts.list(limit=2)
+    assert [c.emailAddress for c in qr.data] == ["a@example.com", "b@example.com"]
+    assert qr.hasMore is False
+
+
+@pytest.mark.parametrize("stream_pages", [False, True], ids=["buffered", "streamed"])
+def test_sidemail_stream_pages_empty_body_matches_buffered(stream_pages):
+    pytest.importorskip("ijson")
+
+    session = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+    client = Sidemail(api_key="key", session=session, stream_pages=stream_pages)
+
+    qr = client.contacts.list(limit=2)
+    assert qr.data == []
+    assert qr.hasMore is False
 
-    result = api.get()
-    assert result.name == "My Project"
 
+@pytest.mark.parametrize("stream_pages", [False, True], ids=["buffered", "streamed"])
+def test_sidemail_stream_pages_invalid_json_matches_buffered(stream_pages):
+    pytest.importorskip("ijson")
 
-def test_project_update(cfg, mock_client):
-    mock_client.patch.return_value = FakeResponse(
-        200,
-        json_data={"id": "p1", "name": "Updated Project"},
+    session = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"not json"))
     )
-    api = _ProjectAPI(cfg, mock_client)
+    client = Sidemail(api_key="key", session=session, stream_pages=stream_pages)
 
-    result = api.update(data={"name": "Updated Project"})
-    assert result.name == "Updated Project"
+    with pytest.raises(SidemailError) as exc:
+        client.contacts.list(limit=2)
+    assert exc.value.httpStatus == 200
 
 
-def test_project_delete(cfg, mock_client):
-    mock_client.delete.return_value = FakeResponse(200, json_data={"deleted": True})
-    api = _ProjectAPI(cfg, mock_client)
+def test_sidemail_stream_pages_raises_api_errors():
+    pytest.importorskip("ijson")
 
-    result = api.delete()
-    assert result.deleted is True
+    def handler(request):
+        return httpx.Response(401, json={"developerMessage": "Nope"})
 
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = Sidemail(api_key="key", session=session, stream_pages=True)
 
-def test_sidemail_requires_api_key(monkeypatch):
-    monkeypatch.delenv("SIDEMAIL_API_KEY", raising=False)
-    with pytest.raises(SidemailError):
-        Sidemail()
+    with pytest.raises(SidemailError) as exc:
+        client.contacts.query(limit=2)
+    assert exc.value.httpStatus == 401
 
 
-def test_sidemail_reads_api_key_from_env(monkeypatch):
-    monkeypatch.setenv("SIDEMAIL_API_KEY", "env-key")
-    client = Sidemail()
-    assert client._cfg.api_key == "env-key"
+def test_sidemail_rejects_unknown_json_backend():
+    with pytest.raises(SidemailError):
+        Sidemail(api_key="key", json_backend="nope")
 
 
 def test_sidemail_send_email_delegates_to_email():
@@ -511,31 +680,12 @@ def test_file_to_attachment_encodes_base64():
     data = b"hello"
     attachment = Sidemail.file_to_attachment("hello.txt", data)
     assert attachment["name"] == "hello.txt"
-    assert attachment["content"] == base64.b64encode(data).decode("ascii")
-
+    assert attachment["content"] == _HELLO_B64
 
-def test_handle_success_no_content_returns_none():
-    # 2xx, but no body at all -> the "return None" branch
-    resp = FakeResponse(status_code=204, json_data=None, text="", content=b"")
-    result = _handle(resp)
-    assert result is None
 
-
-def test_handle_error_non_json_fallback_uses_text():
-    # non-2xx, json() fails -> fallback payload using resp.text
-    resp = FakeResponse(
-        status_code=500,
-        json_data=None,  # this makes FakeResponse.json() raise ValueError
-        text="Server exploded",
-        content=b"",
-    )
-
-    with pytest.raises(SidemailError) as exc:
-        _handle(resp)
-
-    err = exc.value
-    assert "Server exploded" in str(err)
-    assert err.httpStatus == 500
+def test_file_to_attachment_async_matches_sync():
+    attachment = asyncio.run(Sidemail.file_to_attachment_async("hello.txt", b"hello"))
+    assert attachment == Sidemail.file_to_attachment("hello.txt", b"hello")
 
 
 # (Removed) camelize-related behavior is no longer part of the SDK
@@ -559,6 +709,9 @@ def test_query_result_iter_first_page_and_repr():
         hasMore=False,
     )
 
+    # data is the first page's list, not a copy
+    assert qr.data is first_page["data"]
+
     # __iter__
     assert list(iter(qr)) == [{"x": 1}, {"x": 2}]
 
@@ -574,10 +727,10 @@ def test_query_result_iter_first_page_and_repr():
 def test_offset_query_fetch_next_early_stop_branch():
     # First page returns fewer than page_size items, so internal fetch_next
     # should early-return (None, False) without calling fetch_page again.
-    calls = {"count": 0}
+    calls = []
 
     def fetch_page(offset, limit):
-        calls["count"] += 1
+        calls.append(offset)
         # first call (offset 0) returns a single item
         if offset == 0:
             return {"data": [1]}
@@ -592,21 +745,21 @@ def test_offset_query_fetch_next_early_stop_branch():
     nxt, more = qr._fetch_next()  # exercise the early-return branch
     assert nxt is None
     assert more is False
-    assert calls["count"] == 1  # fetch_page not called again by offset_query
+    assert len(calls) == 1  # fetch_page not called again by offset_query
 
     # call fetch_page directly with a non-zero offset to cover the fallback
     assert fetch_page(5, 2) == {"data": []}
-    assert calls["count"] == 2
+    assert len(calls) == 2
 
 
 def test_cursor_query_handles_missing_next_cursor_gracefully():
     # has_more=True but no paginationCursorNext: triggers the
     # "if not next_cur: return None, False" path and the "not Mapping" branch
     # in auto_paginate.
-    calls = {"count": 0}
+    calls = []
 
     def fetch_page(next_cursor, prev_cursor, limit):
-        calls["count"] += 1
+        calls.append((next_cursor, prev_cursor))
         # Only the first call should ever happen
         return {
             "data": [1],
@@ -620,7 +773,7 @@ def test_cursor_query_handles_missing_next_cursor_gracefully():
 
     items = list(qr.auto_paginate())
     assert items == [1]
-    assert calls["count"] == 1  # no second fetch, branch short-circuits
+    assert len(calls) == 1  # no second fetch, branch short-circuits
 
 
 def test_cursor_query_prev_iteration_uses_prev_cursor():
@@ -637,13 +790,7 @@ def test_cursor_query_prev_iteration_uses_prev_cursor():
             }
         if next_cursor is None and prev_cursor == "p1":
             # Older previous page
-            return {
-                "data": [1, 2],
-                "paginationCursorNext": None,
-                "paginationCursorPrev": None,
-                "hasMore": False,
-                "hasPrev": False,
-            }
+            return _single_cursor_page([1, 2])
         # purely defensive; should never be hit
         raise AssertionError(  # pragma: no cover
             f"Unexpected fetch_page call: {next_cursor}, {prev_cursor}, {limit}"
@@ -661,27 +808,17 @@ def test_cursor_query_prev_iteration_uses_prev_cursor():
     assert prev_items == [1, 2]
 
 
-def test_email_search_passes_pagination_cursors(cfg, mock_client):
+def test_email_search_passes_pagination_cursors(mock_client, email_api):
     captured_json = {}
 
-    def fake_post(url, headers=None, json=None, timeout=None):
-        captured_json["payload"] = json
+    def fake_post(url, headers=None, content=None, timeout=None):
+        captured_json["payload"] = json.loads(content)
         # Single empty page; we only care about the request payload.
-        return FakeResponse(
-            200,
-            json_data={
-                "data": [],
-                "paginationCursorNext": None,
-                "paginationCursorPrev": None,
-                "hasMore": False,
-                "hasPrev": False,
-            },
-        )
+        return _EMPTY_CURSOR_PAGE
 
     mock_client.post.side_effect = fake_post
-    api = _EmailAPI(cfg, mock_client)
 
-    api.search(
+    email_api.search(
         status="sent",
         paginationCursorNext="NEXT",
         paginationCursorPrev="PREV",
@@ -696,26 +833,16 @@ def test_email_search_passes_pagination_cursors(cfg, mock_client):
     assert payload["paginationCursorPrev"] == "PREV"
 
 
-def test_contacts_list_passes_pagination_cursors(cfg, mock_client):
+def test_contacts_list_passes_pagination_cursors(mock_client, contacts_api):
     captured_params = {}
 
     def fake_get(url, headers=None, params=None, timeout=None):
         captured_params["params"] = params
-        return FakeResponse(
-            200,
-            json_data={
-                "data": [],
-                "paginationCursorNext": None,
-                "paginationCursorPrev": None,
-                "hasMore": False,
-                "hasPrev": False,
-            },
-        )
+        return _EMPTY_CURSOR_PAGE
 
     mock_client.get.side_effect = fake_get
-    api = _ContactsAPI(cfg, mock_client)
 
-    api.list(paginationCursorNext="NEXT", paginationCursorPrev="PREV", limit=10)
+    contacts_api.list(paginationCursorNext="NEXT", paginationCursorPrev="PREV", limit=10)
 
     params = captured_params["params"]
     assert params["limit"] == 10
@@ -724,12 +851,12 @@ def test_contacts_list_passes_pagination_cursors(cfg, mock_client):
 
 
 def test_cursor_query_prev_without_cursor_returns_none():
-    calls = {"count": 0}
+    calls = []
 
     # First page has has_prev=True but no paginationCursorPrev,
     # so prev_cur stays None internally.
     def fetch_page(next_cursor, prev_cursor, limit):
-        calls["count"] += 1
+        calls.append((next_cursor, prev_cursor))
         assert next_cursor is None
         assert prev_cursor is None
         return {
@@ -750,7 +877,7 @@ def test_cursor_query_prev_without_cursor_returns_none():
     # so it hits line 257 and returns.
     items = list(qr.auto_paginate_prev())
     assert items == []
-    assert calls["count"] == 1
+    assert len(calls) == 1
 
 
 def test_query_result_auto_paginate_prev_empty_items():